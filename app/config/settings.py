@@ -1,22 +1,21 @@
 import logging
-import os
 from datetime import timedelta
-from dotenv import load_dotenv
 
-from typing import Optional
-from pydantic import Field, BaseModel
+from typing import Literal, Optional
+from pydantic import Field, BaseModel, ConfigDict
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from functools import lru_cache
 
-load_dotenv(dotenv_path="./.env")
-
 def setup_logging():
 	"Configure basic logging for the application"
 
 	logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s %(message)s")
 
-class LLMSettings(BaseModel):
+class LLMSettings(BaseSettings):
 	"""LLM Configuration Settings"""
 
+	model_config = SettingsConfigDict(env_file='./.env', extra='ignore', frozen=True)
+
 	temperature: float = 0.0
 	max_tokens: Optional[int] = None
 	max_retries: int = 3
@@ -24,25 +23,40 @@ class LLMSettings(BaseModel):
 class OpenAISettings(LLMSettings):
 	"OpenAI Specific Settings - LLMSettings combined"
 
-	api_key: str = Field(default_factory=lambda: os.getenv('OPENAI_API_KEY'))
+	model_config = SettingsConfigDict(env_prefix='OPENAI_')
+
+	api_key: Optional[str] = None
 	default_model: str = Field(default='gpt-4o-mini')
 	embedding_model: str = Field(default='text-embedding-3-small')
 
-class DatabaseSettings(BaseModel):
+class DatabaseSettings(BaseSettings):
 	"""Database Connection Settings"""
 
-	service_url: str = Field(default_factory=lambda: os.getenv('TIMESCALE_SERVICE_URL'))
+	model_config = SettingsConfigDict(env_prefix='TIMESCALE_', env_file='./.env', extra='ignore', frozen=True)
+
+	service_url: Optional[str] = None
 
 class VectorStoreSettings(BaseModel):
 	"""Settings for the Vectorstore"""
 
+	model_config = ConfigDict(frozen=True)
+
 	table_name: str = 'embeddings'
 	embedding_dimensions: int = 1536
+	# halfvec halves storage but needs a pgvectorscale release with DiskANN support for halfvec
+	vector_type: Literal['vector', 'halfvec'] = 'vector'
 	time_partition_levels: timedelta = timedelta(days=7)
+	batch_api_min_rows: int = 1000
+	bulk_copy_threshold: int = 1000
+	upsert_batch_size: int = 10000
+	async_commit_on_bulk_load: bool = False
+	embedding_cache_path: Optional[str] = None
 
 class Settings(BaseModel):
 	"""Combining All Base Settings"""
 
+	model_config = ConfigDict(frozen=True)
+
 	openai: OpenAISettings = Field(default_factory=OpenAISettings)
 	database: DatabaseSettings = Field(default_factory=DatabaseSettings)
 	vector_store: VectorStoreSettings = Field(default_factory=VectorStoreSettings)
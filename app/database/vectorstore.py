@@ -1,23 +1,181 @@
+import asyncio
+import base64
+import diskcache
+import io
+import json
+import logging
+import os
+import struct
+import threading
+import time
+import uuid
+import numpy as np
 import pandas as pd
-from openai import OpenAI
+import psycopg
+from openai import AsyncOpenAI, OpenAI
+from psycopg import sql
 from timescale_vector import client
 
 from typing import Any, List, Optional, Union, Tuple
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from config.settings import get_settings
+from collections import OrderedDict
+from config.settings import VectorStoreSettings, get_settings
+
+# Binary COPY stream framing (signature, flags, header extension length / end-of-data marker)
+_COPY_HEADER = b'PGCOPY\n\xff\r\n\x00' + struct.pack('>ii', 0, 0)
+_COPY_TRAILER = struct.pack('>h', -1)
+
+# Big-endian element types of the pgvector binary formats
+_VECTOR_DTYPES = {'vector': '>f4', 'halfvec': '>f2'}
+
+# Batch API limits per input file (request lines and bytes, with headroom under the 200 MB cap)
+_BATCH_API_MAX_REQUESTS = 50_000
+_BATCH_API_MAX_FILE_BYTES = 190 * 1024 * 1024
+
+# Size of the slices written to the COPY stream
+_COPY_WRITE_SIZE = 8 * 1024 * 1024
+
+
+def _encode_copy_rows(df: pd.DataFrame, vector_type: str) -> bytearray:
+	"""Function to encode records as PostgreSQL binary COPY tuples into one pre-allocated buffer."""
+
+	dtype = np.dtype(_VECTOR_DTYPES[vector_type])
+
+	# Encoding variable length fields up front to size the buffer
+	ids = [uuid.UUID(str(record_id)).bytes for record_id in df['id']]
+	metadata_fields = [b'\x01' + json.dumps(metadata).encode('utf-8') for metadata in df['metadata']]
+	content_fields = [content.encode('utf-8') for content in df['content']]
+	embeddings = df['embedding'].tolist()
+
+	# Sizing each tuple as field count, four length words, uuid, vector header and the variable length fields
+	buffer_size = sum(
+		2 + 16 + 16 + 4 + len(metadata_field) + len(content_field) + len(embedding) * dtype.itemsize
+		for metadata_field, content_field, embedding in zip(metadata_fields, content_fields, embeddings)
+	)
+	buffer = bytearray(buffer_size)
+	offset = 0
+
+	for id_field, metadata_field, content_field, embedding in zip(ids, metadata_fields, content_fields, embeddings):
+
+		# Writing field count followed by the length prefixed id, metadata and content fields
+		struct.pack_into('>h', buffer, offset, 4)
+		offset += 2
+		for field in (id_field, metadata_field, content_field):
+			struct.pack_into('>i', buffer, offset, len(field))
+			buffer[offset + 4:offset + 4 + len(field)] = field
+			offset += 4 + len(field)
+
+		# Writing the vector header and filling its elements in place
+		dim = len(embedding)
+		struct.pack_into('>iHH', buffer, offset, 4 + dim * dtype.itemsize, dim, 0)
+		offset += 8
+		np.ndarray((dim,), dtype, buffer, offset)[:] = embedding
+		offset += dim * dtype.itemsize
+
+	return buffer
+
+
+def _decode_embedding(encoded: str) -> np.ndarray:
+	"""Function to decode a base64 encoded float32 embedding."""
+
+	return np.frombuffer(base64.b64decode(encoded), dtype='<f4')
+
+
+def _embedding_to_numpy(embedding: Any) -> np.ndarray:
+	"""Function to convert a fetched embedding (pgvector Vector / HalfVector, list or array) to a float32 array."""
+
+	# pgvector objects returned for vector and halfvec columns expose to_numpy instead of the array protocol
+	if hasattr(embedding, 'to_numpy'):
+		return embedding.to_numpy().astype(np.float32)
+
+	return np.asarray(embedding, dtype=np.float32)
+
+
+def _clean_texts(texts: Union[pd.Series, List[str]]) -> List[str]:
+	"""Function to remove \n from all input texts in one vectorized pass."""
+
+	return pd.Series(texts).str.replace('\n', ' ', regex=False).tolist()
+
+
+def _create_embeddings(openai_client: OpenAI, embedding_model: str, texts: List[str]) -> List[np.ndarray]:
+	"""Function to create embeddings for a list of texts in a single API call."""
+
+	response = openai_client.embeddings.create(input=texts, model=embedding_model, encoding_format='base64')
+
+	return [_decode_embedding(data.embedding) for data in response.data]
+
+
+# Process level LRU cache of query embeddings keyed on (embedding_model, normalized_text)
+_QUERY_EMBEDDING_CACHE_SIZE = 10_000
+_query_embedding_cache: OrderedDict = OrderedDict()
+_query_embedding_cache_lock = threading.Lock()
+
+
+def _batch_error_message(result: dict) -> str:
+	"""Function to format the error of a failed Batch API request line."""
+
+	error = result.get('error') or ((result.get('response') or {}).get('body') or {}).get('error') or {}
+
+	return f"request {result.get('custom_id')}: {error.get('message', 'unknown error')}"
+
+
+def _set_bulk_load_options(connection: psycopg.Connection) -> None:
+	"""Function to relax commit durability and raise memory limits for the current transaction."""
+
+	connection.execute("SET LOCAL synchronous_commit = off")
+	connection.execute("SET LOCAL work_mem = '64MB'")
+	connection.execute("SET LOCAL maintenance_work_mem = '1GB'")
+
+
+def _copy_records(
+		connection: psycopg.Connection, 
+		table_name: str, 
+		df: pd.DataFrame, 
+		vector_type: str, 
+		batch_size: Optional[int] = None
+		) -> None:
+	"""Function to insert records to a table using a single binary COPY, encoding batch_size rows at a time."""
+
+	copy_query = sql.SQL("COPY {} (id, metadata, contents, embedding) FROM STDIN WITH (FORMAT BINARY)").format(sql.Identifier(table_name))
+	batch_size = batch_size or max(len(df), 1)
+
+	with connection.cursor() as cursor:
+		with cursor.copy(copy_query) as copy:
+			copy.write(_COPY_HEADER)
+
+			# Encoding records slice by slice so only one slice is held in memory, streaming each buffer in pieces
+			for row_start in range(0, len(df), batch_size):
+				buffer = memoryview(_encode_copy_rows(df.iloc[row_start:row_start + batch_size], vector_type))
+				for start in range(0, len(buffer), _COPY_WRITE_SIZE):
+					copy.write(buffer[start:start + _COPY_WRITE_SIZE])
+
+			copy.write(_COPY_TRAILER)
+
+
+def _copy_worker(service_url: str, table_name: str, df: pd.DataFrame, vector_type: str, async_commit: bool) -> int:
+	"""Function to copy a slice of records on its own connection, run inside worker processes."""
+
+	with psycopg.connect(service_url) as connection:
+		with connection.transaction():
+			if async_commit:
+				_set_bulk_load_options(connection)
+			_copy_records(connection, table_name, df, vector_type)
+
+	return len(df)
 
 
 class VectorStore:
 	
-	def __init__(self):
-		"""Initializing all parameters."""
+	def __init__(self, vector_settings: Optional[VectorStoreSettings] = None):
+		"""Initializing all parameters, optionally overriding the vectorstore settings."""
 
 		# Collecting parameters from settings
 		self.settings = get_settings()
 		self.service_url = self.settings.database.service_url
 		self.openai_client = OpenAI(api_key=self.settings.openai.api_key)
 		self.embedding_model = self.settings.openai.embedding_model
-		self.vector_settings = self.settings.vector_store
+		self.vector_settings = vector_settings or self.settings.vector_store
 
 		# Creating Vectorstore client
 		self.vec_client = client.Sync(
@@ -27,16 +185,176 @@ class VectorStore:
 			time_partition_interval=self.vector_settings.time_partition_levels
 		)
 
-	def get_embedding(self, text: str) -> List[float]:
+	def get_embedding(self, text: str) -> np.ndarray:
 		"""Function to create embeddings from plain text."""
 
-		# Cleaning input text to remove \n
-		text = text.replace('\n', ' ')
+		# Getting embedding through the shared query embedding cache
+		return self.get_query_embeddings([text])[0]
+
+	def get_query_embeddings(self, texts: List[str]) -> List[np.ndarray]:
+		"""Function to create query embeddings, cached per process and optionally on disk."""
+
+		# Normalizing case and whitespace so repeated queries share a cache entry, embeddings use the original text
+		keys = [(self.embedding_model, ' '.join(text.lower().split())) for text in texts]
+		cache_path = self.vector_settings.embedding_cache_path
+
+		# Collecting embeddings from the process cache, then from the persistent cache if available
+		with _query_embedding_cache_lock:
+			embeddings = {key: _query_embedding_cache[key] for key in keys if key in _query_embedding_cache}
+		missing = {key: text for key, text in zip(keys, texts) if key not in embeddings}
+		if missing and cache_path:
+			with diskcache.Cache(cache_path) as cache:
+				for key in list(missing):
+					embedding = cache.get(key)
+					if embedding is not None:
+						embeddings[key] = embedding
+						del missing[key]
+
+		# Creating embeddings for the remaining queries in batched calls and storing them in the persistent cache
+		if missing:
+			new_embeddings = dict(zip(missing, self.get_embeddings_batch(list(missing.values()))))
+			embeddings.update(new_embeddings)
+			if cache_path:
+				with diskcache.Cache(cache_path) as cache:
+					for key, embedding in new_embeddings.items():
+						cache.set(key, embedding)
+
+		# Refreshing recency in the process cache and evicting the least recently used entries
+		with _query_embedding_cache_lock:
+			for key in keys:
+				_query_embedding_cache[key] = embeddings[key]
+				_query_embedding_cache.move_to_end(key)
+			while len(_query_embedding_cache) > _QUERY_EMBEDDING_CACHE_SIZE:
+				_query_embedding_cache.popitem(last=False)
+
+		return [embeddings[key] for key in keys]
+
+	def get_embeddings_batch(self, texts: Union[pd.Series, List[str]], batch_size: int = 256) -> List[np.ndarray]:
+		"""Function to create embeddings for a list of texts in batched API calls."""
+
+		# Cleaning input texts to remove \n
+		texts = _clean_texts(texts)
+
+		# Creating embeddings chunk by chunk, one API call per chunk
+		embeddings = []
+		for start in range(0, len(texts), batch_size):
+			embeddings.extend(_create_embeddings(self.openai_client, self.embedding_model, texts[start:start + batch_size]))
+
+		return embeddings
+
+	async def aget_embeddings(self, texts: Union[pd.Series, List[str]], batch_size: int = 256, concurrency: int = 16) -> List[np.ndarray]:
+		"""Function to create embeddings for a list of texts with concurrent batched API calls."""
+
+		# Cleaning input texts to remove \n
+		texts = _clean_texts(texts)
+
+		# Limiting the number of requests in flight
+		semaphore = asyncio.Semaphore(concurrency)
+
+		async with AsyncOpenAI(api_key=self.settings.openai.api_key) as async_client:
+
+			async def embed_chunk(chunk: List[str]) -> List[np.ndarray]:
+				async with semaphore:
+					response = await async_client.embeddings.create(input=chunk, model=self.embedding_model, encoding_format='base64')
+				return [_decode_embedding(data.embedding) for data in response.data]
+
+			# Creating embeddings for all chunks concurrently, keeping input order
+			chunks = [texts[start:start + batch_size] for start in range(0, len(texts), batch_size)]
+			results = await asyncio.gather(*(embed_chunk(chunk) for chunk in chunks))
+
+		return [embedding for chunk_embeddings in results for embedding in chunk_embeddings]
+
+	def embed_via_batch_api(self, texts: Union[pd.Series, List[str]], batch_size: int = 256, poll_interval: int = 30) -> List[np.ndarray]:
+		"""Function to create embeddings for a list of texts using the asynchronous OpenAI Batch API."""
+
+		texts = _clean_texts(texts)
+
+		# Creating one JSONL request line per chunk of texts, keyed by the position of its first text
+		lines = [
+			json.dumps({
+				'custom_id': str(start),
+				'method': 'POST',
+				'url': '/v1/embeddings',
+				'body': {'model': self.embedding_model, 'input': texts[start:start + batch_size], 'encoding_format': 'base64'}
+			}).encode('utf-8')
+			for start in range(0, len(texts), batch_size)
+		]
+
+		# Splitting request lines into input files within the Batch API request count and file size limits
+		input_files, current_file, current_size = [], [], 0
+		for line in lines:
+			if current_file and (len(current_file) == _BATCH_API_MAX_REQUESTS or current_size + len(line) + 1 > _BATCH_API_MAX_FILE_BYTES):
+				input_files.append(current_file)
+				current_file, current_size = [], 0
+			current_file.append(line)
+			current_size += len(line) + 1
+		if current_file:
+			input_files.append(current_file)
+
+		# Submitting all batch jobs before polling so they run side by side
+		batches = [self._submit_embedding_batch(input_file) for input_file in input_files]
+
+		# Waiting for each batch job and reassembling embeddings by position
+		embeddings = [None] * len(texts)
+		errors = []
+		for batch in batches:
+			errors.extend(self._collect_batch_embeddings(batch, embeddings, poll_interval))
+
+		# Raising error if any request failed inside the batches
+		if errors or any(embedding is None for embedding in embeddings):
+			raise RuntimeError(
+				f"Embedding batches returned incomplete results, {len(errors)} requests failed. Errors: {'; '.join(errors[:10])}"
+			)
+
+		return embeddings
+
+	def _submit_embedding_batch(self, lines: List[bytes]) -> Any:
+		"""Function to upload a JSONL request file and submit it as a Batch API job."""
+
+		batch_file = self.openai_client.files.create(
+			file=('embeddings.jsonl', io.BytesIO(b'\n'.join(lines))),
+			purpose='batch'
+		)
+
+		return self.openai_client.batches.create(
+			input_file_id=batch_file.id,
+			endpoint='/v1/embeddings',
+			completion_window='24h'
+		)
+
+	def _collect_batch_embeddings(self, batch: Any, embeddings: List[Optional[np.ndarray]], poll_interval: int) -> List[str]:
+		"""Function to wait for a Batch API job, fill its embeddings in place and return per-request errors."""
+
+		# Polling until the batch job reaches a final state
+		while batch.status not in ('completed', 'failed', 'expired', 'cancelled'):
+			time.sleep(poll_interval)
+			batch = self.openai_client.batches.retrieve(batch.id)
+
+		# Raising error if the batch job did not complete
+		if batch.status != 'completed':
+			raise RuntimeError(f"Embedding batch {batch.id} ended with status '{batch.status}'.")
 
-		# Creting embedding for input text using openai embedding model
-		embedding = (self.openai_client.embeddings.create(input=[text], model=self.embedding_model).data[0].embedding)
+		# Collecting per-request errors reported in the error file
+		errors = []
+		if batch.error_file_id:
+			for line in self.openai_client.files.content(batch.error_file_id).text.splitlines():
+				errors.append(_batch_error_message(json.loads(line)))
 
-		return embedding
+		# Raising error if no request in the batch succeeded
+		if not batch.output_file_id:
+			raise RuntimeError(f"Embedding batch {batch.id} returned no results. Errors: {'; '.join(errors[:10])}")
+
+		# Downloading results and placing each embedding at its request offset plus its index in the request
+		for line in self.openai_client.files.content(batch.output_file_id).text.splitlines():
+			result = json.loads(line)
+			if (result.get('response') or {}).get('status_code') == 200:
+				offset = int(result['custom_id'])
+				for data in result['response']['body']['data']:
+					embeddings[offset + data['index']] = _decode_embedding(data['embedding'])
+			else:
+				errors.append(_batch_error_message(result))
+
+		return errors
 
 	def create_tables(self) -> None:
 		"""Function to create table to store embeddings."""
@@ -44,6 +362,31 @@ class VectorStore:
 		# Creating table using vec_client
 		self.vec_client.create_tables()
 
+		table_name = self.vector_settings.table_name
+		vector_type = self.vector_settings.vector_type
+
+		with psycopg.connect(self.service_url) as connection:
+
+			# Looking up the current type of the embedding column
+			column = connection.execute(
+				"SELECT udt_name FROM information_schema.columns "
+				"WHERE table_schema = current_schema() AND table_name = %s AND column_name = 'embedding'",
+				(table_name,)
+			).fetchone()
+
+			# Changing embedding column type only when it differs from the configured vector_type
+			if column and column[0] != vector_type:
+
+				# Dropping the embedding index first as it is bound to the old column type
+				self.drop_index()
+				connection.execute(
+					sql.SQL("ALTER TABLE {} ALTER COLUMN embedding TYPE {}({})").format(
+						sql.Identifier(table_name),
+						sql.SQL(vector_type),
+						sql.Literal(self.vector_settings.embedding_dimensions)
+					)
+				)
+
 	def create_index(self) -> None:
 		"""Function to create index using DiskAnnIndex."""
 
@@ -59,11 +402,117 @@ class VectorStore:
 	def upsert(self, df: pd.DataFrame) -> None:
 		"""Function to upload/insert embeddings and data to psostgres table."""
 
+		batch_size = self.vector_settings.upsert_batch_size
+
+		# Casting embeddings to half precision when stored as halfvec
+		if self.vector_settings.vector_type == 'halfvec':
+			df = df.assign(embedding=[np.asarray(embedding, dtype=np.float16) for embedding in df['embedding']])
+
+		# Using binary COPY for bulk loads to skip the per-row INSERT path, one transaction per batch
+		if len(df) > self.vector_settings.bulk_copy_threshold:
+			with psycopg.connect(self.service_url) as connection:
+				for start in range(0, len(df), batch_size):
+					started_at = time.perf_counter()
+					batch = df.iloc[start:start + batch_size]
+					with connection.transaction():
+						if self.vector_settings.async_commit_on_bulk_load:
+							_set_bulk_load_options(connection)
+						_copy_records(connection, self.vector_settings.table_name, batch, self.vector_settings.vector_type)
+					self._log_batch_rate(len(batch), started_at)
+			return
+
 		# Converting DataFrame to records
-		records = df.to_records(index=False)
+		records = list(df.to_records(index=False))
+
+		# Inserting records to table batch by batch
+		for start in range(0, len(records), batch_size):
+			started_at = time.perf_counter()
+			batch = records[start:start + batch_size]
+			self.vec_client.upsert(batch)
+			self._log_batch_rate(len(batch), started_at)
+
+	def bulk_load(self, df: pd.DataFrame) -> None:
+		"""Function to bulk load data, building the index once after all rows are inserted."""
+
+		# Dropping the index so inserts do not maintain it row by row
+		self.drop_index()
+
+		# Inserting data and rebuilding the index over all vectors at once
+		self.upsert(df)
+		self.create_index()
+
+		# Refreshing visibility map and planner statistics after the load
+		self.vacuum_analyze()
+
+	def bulk_load_via_staging(self, df: pd.DataFrame) -> None:
+		"""Function to bulk load data through an UNLOGGED staging table and a server side INSERT ... SELECT."""
+
+		table = sql.Identifier(self.vector_settings.table_name)
+		stage_table_name = f"{self.vector_settings.table_name}_stage"
+		stage_table = sql.Identifier(stage_table_name)
+
+		with psycopg.connect(self.service_url) as connection:
+			with connection.transaction():
+
+				# Relaxing commit durability for the load transaction if enabled
+				if self.vector_settings.async_commit_on_bulk_load:
+					_set_bulk_load_options(connection)
+
+				# Creating staging table without indexes, skipping WAL for the COPY
+				connection.execute(sql.SQL("CREATE UNLOGGED TABLE {} (LIKE {} INCLUDING DEFAULTS)").format(stage_table, table))
+
+				# Copying records to staging table
+				_copy_records(connection, stage_table_name, df, self.vector_settings.vector_type, self.vector_settings.upsert_batch_size)
+
+				# Moving all rows to the embeddings table in a single statement and dropping the staging table
+				connection.execute(
+					sql.SQL("INSERT INTO {} (id, metadata, contents, embedding) SELECT id, metadata, contents, embedding FROM {}").format(table, stage_table)
+				)
+				connection.execute(sql.SQL("DROP TABLE {}").format(stage_table))
+
+	def parallel_bulk_copy(self, df: pd.DataFrame, max_workers: Optional[int] = None) -> None:
+		"""Function to bulk copy records from worker processes, in upsert_batch_size slices of each time partition."""
+
+		started_at = time.perf_counter()
 
-		# Inserting records to table
-		self.vec_client.upsert(list(records))
+		# Splitting records into buckets aligned with the hypertable time partitions
+		created_at = pd.to_datetime([metadata['created_at'] for metadata in df['metadata']])
+		buckets = [bucket for _, bucket in df.groupby(created_at.floor(self.vector_settings.time_partition_levels))]
+
+		# Slicing buckets so each worker task holds a bounded number of rows and single partition loads still spread across workers
+		batch_size = self.vector_settings.upsert_batch_size
+		slices = [bucket.iloc[start:start + batch_size] for bucket in buckets for start in range(0, len(bucket), batch_size)]
+
+		# Copying each slice from a worker process on its own connection
+		with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+			futures = [
+				executor.submit(
+					_copy_worker,
+					self.service_url,
+					self.vector_settings.table_name,
+					records,
+					self.vector_settings.vector_type,
+					self.vector_settings.async_commit_on_bulk_load
+				)
+				for records in slices
+			]
+			num_rows = sum(future.result() for future in futures)
+
+		self._log_batch_rate(num_rows, started_at)
+
+	def vacuum_analyze(self) -> None:
+		"""Function to run VACUUM ANALYZE on the embeddings table."""
+
+		# Running outside a transaction block as VACUUM requires
+		with psycopg.connect(self.service_url, autocommit=True) as connection:
+			connection.execute(sql.SQL("VACUUM ANALYZE {}").format(sql.Identifier(self.vector_settings.table_name)))
+
+	@staticmethod
+	def _log_batch_rate(num_rows: int, started_at: float) -> None:
+		"""Function to log insert throughput of a batch."""
+
+		elapsed = time.perf_counter() - started_at
+		logging.info(f"Inserted {num_rows} rows in {elapsed:.2f}s ({num_rows / max(elapsed, 1e-9):.0f} rows/sec)")
 
 	def search(
 			self, 
@@ -79,6 +528,53 @@ class VectorStore:
 		# Creating embedding for input query_text
 		query_embedding = self.get_embedding(query_text)
 
+		# Creating search parameters from inputs
+		search_params = self._create_search_params(limit, metadata_filter, predicates, time_range)
+
+		# Searching for embeddings similar to input_text in the vector database
+		results = self.vec_client.search(query_embedding, **search_params)
+
+		# Retrning df if return_dataframe is set True else records
+		if return_dataframe:
+			return self.create_dataframe_from_result(results)
+		else:
+			return results
+
+	def search_many(
+			self, 
+			queries: List[str], 
+			limit: int = 5, 
+			metadata_filter: Union[dict, List[dict]] = None, 
+			predicates: Optional[client.Predicates] = None, 
+			time_range: Optional[Tuple[datetime, datetime]] = None, 
+			return_dataframe: bool = True
+			) -> List[Union[List[Tuple[Any, ...]], pd.DataFrame]]:
+		"""Function to search for relavant embeddings for multiple queries, sharing one embedding API call."""
+
+		# Creating embeddings for all queries in batched calls
+		query_embeddings = self.get_query_embeddings(queries)
+
+		# Creating search parameters from inputs
+		search_params = self._create_search_params(limit, metadata_filter, predicates, time_range)
+
+		# Searching the vector database for each query embedding
+		results = [self.vec_client.search(query_embedding, **search_params) for query_embedding in query_embeddings]
+
+		# Retrning dfs if return_dataframe is set True else records
+		if return_dataframe:
+			return [self.create_dataframe_from_result(result) for result in results]
+		else:
+			return results
+
+	@staticmethod
+	def _create_search_params(
+			limit: int, 
+			metadata_filter: Union[dict, List[dict]] = None, 
+			predicates: Optional[client.Predicates] = None, 
+			time_range: Optional[Tuple[datetime, datetime]] = None
+			) -> dict:
+		"""Function to create the search parameters map for vec_client.search."""
+
 		# Creating a map to store search parameters
 		search_params = {
 			'limit': limit
@@ -97,26 +593,22 @@ class VectorStore:
 			start_date, end_date = time_range
 			search_params['uuid_time_filter'] = client.UUIDTimeRange(start_date, end_date)
 
-		# Searching for embeddings similar to input_text in the vector database
-		results = self.vec_client.search(query_embedding, **search_params)
-
-		# Retrning df if return_dataframe is set True else records
-		if return_dataframe:
-			return self.create_dataframe_from_result(results)
-		else:
-			return results
+		return search_params
 
 	def create_dataframe_from_result(self, results: List[Tuple[Any, ...]]) -> pd.DataFrame:
 		"""Function to create dataframe from fetched search results."""
 
-		# Creating table with necessary column names
-		results_df = pd.DataFrame(results, columns=['id', 'metadata', 'content', 'embedding', 'distance'])
-
-		# Exploding metadata column and combining
-		results_df = pd.concat([results_df.drop('metadata', axis=1), results_df['metadata'].apply(pd.Series)], axis=1)
-
-		# Typecasting id column as string
-		results_df['id'] = results_df['id'].astype(str)
+		# Creating table with explicitly typed columns so pandas skips type inference
+		results_df = pd.DataFrame({
+			'id': pd.array([str(result[0]) for result in results], dtype='string'),
+			'content': pd.array([result[2] for result in results], dtype='string'),
+			'embedding': [_embedding_to_numpy(result[3]) for result in results],
+			'distance': np.array([result[4] for result in results], dtype=np.float32)
+		})
+
+		# Exploding metadata in a single pass and combining
+		metadata_df = pd.json_normalize([result[1] for result in results])
+		results_df = pd.concat([results_df, metadata_df], axis=1)
 
 		return results_df
 
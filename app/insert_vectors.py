@@ -1,43 +1,44 @@
-from datetime import datetime
+import argparse
+import asyncio
+from datetime import datetime, timedelta
 import pandas as pd
+import pyarrow.csv as pacsv
 from timescale_vector.client import uuid_from_time
+from config.settings import get_settings
 from database.vectorstore import VectorStore
 
+# Parsing command line arguments
+parser = argparse.ArgumentParser(description="Insert FAQ dataset as vectors to the vector database.")
+parser.add_argument('--batch', action='store_true', help="Create embeddings using the OpenAI Batch API.")
+args = parser.parse_args()
 
-def prepare_record(row):
-    """Function to prepare records to be inserted to the vector database, after creating the embeddings."""
+# Initializing vectorstore with synchronous_commit turned off for this one-shot bulk load
+vector_settings = get_settings().vector_store.model_copy(update={'async_commit_on_bulk_load': True})
+vector_store = VectorStore(vector_settings=vector_settings)
 
-    # Creating question answer pair strings
-    content = f"Question: {row['question']}\nAnswer: {row['answer']}"
+# Loading data with the multi-threaded pyarrow reader and converting to arrow backed pandas dataframe
+table = pacsv.read_csv('../data/faq_dataset.csv', parse_options=pacsv.ParseOptions(delimiter=';'))
+df = table.to_pandas(types_mapper=pd.ArrowDtype)
 
-    # Creating embedding for the content
-    content_embedding = vector_store.get_embedding(content)
+# Creating question answer pair strings for all rows at once
+df['content'] = "Question: " + df['question'] + "\nAnswer: " + df['answer']
 
-    # Creating a series from the required data
-    record_series = pd.Series(
-        {
-            'id': str(uuid_from_time(datetime.now())),
-            'metadata': {
-                'category': row['category'],
-                'created_at': datetime.now().isoformat()
-            },
-            'content': content,
-            'embedding': content_embedding
-        }
-    )
+# Creating embeddings through the Batch API for large loads, else in concurrent batched API calls
+if args.batch and len(df) >= vector_store.vector_settings.batch_api_min_rows:
+    df['embedding'] = vector_store.embed_via_batch_api(df['content'])
+else:
+    df['embedding'] = asyncio.run(vector_store.aget_embeddings(df['content']))
 
-    return record_series
-    
-# Initializing vectorstore
-vector_store = VectorStore()
+# Creating ids and metadata columns for all rows from a single load timestamp
+now = datetime.now()
+now_iso = now.isoformat()
+df['metadata'] = [{'category': category, 'created_at': now_iso} for category in df['category']]
+df['id'] = [str(uuid_from_time(now + timedelta(microseconds=i))) for i in range(len(df))]
 
-# Loading data to pandas dataframe
-df = pd.read_csv('../data/faq_dataset.csv', delimiter=';')
+# Selecting the columns to be inserted to the vector database
+df = df[['id', 'metadata', 'content', 'embedding']]
 
-# Applying record preparation funciton to each record
-df = df.apply(prepare_record, axis=1)
-
-# Creating Table, Index and Inserting data to table
+# Creating Table, Inserting data to table and building Index afterwards
 vector_store.create_tables()
-vector_store.create_index()
-vector_store.upsert(df)
\ No newline at end of file
+vector_store.bulk_load(df)
+
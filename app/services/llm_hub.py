@@ -1,10 +1,16 @@
 from typing import List, Dict, Any, Type
+from functools import lru_cache
 import instructor
 from openai import OpenAI
 from pydantic import BaseModel
 
 from config.settings import get_settings
 
+# Registry of LLM client initializers by provider
+_PROVIDERS = {
+	'openai': lambda x: instructor.from_openai(OpenAI(api_key=x.api_key))
+}
+
 class LLMHub:
     
 	def __init__(self, provider: str):
@@ -17,13 +23,8 @@ class LLMHub:
 	def _initialize_client(self) -> Any:
 		"""Function to initialize client."""
 
-		# Creating a dict of multiple LLM initializers
-		client_initializers = {
-			'openai': lambda x: instructor.from_openai(OpenAI(api_key=x.api_key))
-		}
-
 		# Initializing selected initializer
-		initializer = client_initializers.get(self.provider)
+		initializer = _PROVIDERS.get(self.provider)
 
 		# Checking if initializer valid and returning client
 		if initializer:
@@ -45,4 +46,10 @@ class LLMHub:
 		}
 
 		# Creating completion
-		return self.client.chat.completions.create(**completion_params)
\ No newline at end of file
+		return self.client.chat.completions.create(**completion_params)
+
+@lru_cache
+def get_llm(provider: str) -> LLMHub:
+	"""Creating and returning cached LLMHub instance for the provider"""
+
+	return LLMHub(provider)
@@ -1,7 +1,8 @@
+import orjson
 import pandas as pd
 from typing import List
 from pydantic import BaseModel, Field
-from services.llm_hub import LLMHub
+from services.llm_hub import get_llm
 
 
 class SynthesizedResponse(BaseModel):
@@ -33,9 +34,10 @@ class Responder:
 	def dataframe_to_json(context: pd.DataFrame, columns_to_keep: List[str]) -> str:
 		"""Function to convert pandas dataframe to json."""
 
-		# Converting pandas dataframe to json
-		return context[columns_to_keep].to_json(orient='records', indent=4)
+		# Converting pandas dataframe to compact json, without indentation to save prompt tokens
+		return orjson.dumps(context[columns_to_keep].to_dict('records')).decode()
 
+	@staticmethod
 	def generate_response(question: str, context: pd.DataFrame) -> SynthesizedResponse:
 		"""Function to get answer for question from LLM using the collected context."""
 
@@ -52,8 +54,8 @@ class Responder:
 			},
 		]
 
-		# Creating LLM Instance
-		llm = LLMHub('openai')
+		# Getting cached LLM Instance
+		llm = get_llm('openai')
 		# Getting Response (Answer to user question) form LLM
 		response = llm.create_completion(response_model=SynthesizedResponse, messages=messages)
 		